@@ -11,33 +11,103 @@ Last Updated: February 2026
 """
 
 from pathlib import Path
+import argparse
+import hashlib
 import time
 import json
 import random
 import re
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlencode
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Tuple, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin
 
 # Optional: Playwright for Cloudflare bypass
 try:
     from playwright.sync_api import sync_playwright
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+# Optional: orjson for faster parsing of the large World Athletics JSON payload
+try:
+    import orjson
+    json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    json_loads = json.loads
+
 # Configuration
 OPENTRACK_URL = "https://malta.opentrack.run/en-gb/a/f77598db-2a2a-4597-a0d1-0ee86eda6147/"
 WORLD_ATHLETICS_URL = "https://worldathletics.org/athletes/malta/graham-pellegrini-14962811"
 ATHLETICS_MALTA_RECORDS_URL = "https://athleticsmalta.com/records/"
 ATHLETICS_MALTA_RECORDS_RESULTS_URL = "https://athleticsmalta.com/records/?sf_data=results"
 
+# Resource types Playwright skips downloading; only the (JS-rendered) HTML is needed
+PLAYWRIGHT_BLOCKED_RESOURCES = {"image", "font", "stylesheet", "media"}
+
+# Analytics/ad hosts whose scripts only delay rendering of the tables
+PLAYWRIGHT_BLOCKED_URL_RE = re.compile(r'google-analytics|googletagmanager|doubleclick|facebook\.net|hotjar')
+
+# Chromium switches that drop background work and image decoding the scrape never needs
+PLAYWRIGHT_LAUNCH_ARGS = [
+    "--blink-settings=imagesEnabled=false",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-features=TranslateUI",
+]
+
+# Concurrent Athletics Malta ranking lookups (one request per event)
+ATHLETICS_MALTA_MAX_WORKERS = 5
+
+# Validators (ETag/Last-Modified) and parsed results from previous runs, keyed by URL
+HTTP_CACHE_PATH = Path(".pb_cache.json")
+
+# Bump whenever page parsing changes, so results parsed by older code are not reused
+HTTP_CACHE_VERSION = 1
+
+# Playwright-rendered pages cached on disk (override TTL via OPENTRACK_CACHE_TTL, in seconds)
+RENDER_CACHE_DIR = Path(".pb_cache")
+RENDER_CACHE_TTL = 6 * 60 * 60
+
 # Standard event distances (in meters)
 TARGET_EVENTS = ["60", "100", "200", "300", "400", "800", "1500"]
+TARGET_EVENTS_SET = frozenset(TARGET_EVENTS)
+
+# OpenTrack event code -> tracker event key (e.g. "200" -> "200m")
+_OPENTRACK_EVENT_KEYS = {dist: f"{dist}m" for dist in TARGET_EVENTS}
+
+# Case-insensitive event-name matchers, so names never need lowercased copies
+_RELAY_RE = re.compile(r'relay', re.IGNORECASE)
+_SHORT_TRACK_RE = re.compile(r'short\s+track', re.IGNORECASE)
+_INDOOR_RE = re.compile(r'indoor', re.IGNORECASE)
+
+# Distance in World Athletics discipline names (e.g. "200 Metres Short Track")
+_METRES_RE = re.compile(r'(\d+)\s*(?:metre|meter)', re.IGNORECASE)
+
+# Athletics Malta event names (e.g. "200m", "4x100m") and tracker event keys (e.g. "200m")
+_AM_EXCLUDED_RE = re.compile(r'relay|hurdle|walk', re.IGNORECASE)
+_RELAY_XM_RE = re.compile(r'^(\d+)\s*x\s*\d+m$', re.IGNORECASE)
+_AM_METRES_RE = re.compile(r'^(\d+)\s*m(?:etres?)?$', re.IGNORECASE)
+_EVENT_KEY_RE = re.compile(r'^\d+m$')
+
+# Mark as seconds ("21.18"), m:ss.xx ("1:55.20") or m.ss.xx ("1.55.20"), optional "s" suffix
+_SECONDS_RE = re.compile(r'\s*(?:(\d+)(?::|\.(?=\d+\.\d))(\d+(?:\.\d+)?)|(\d+\.?\d*|\.\d+))\s*s?\s*')
+
+# Athletics Malta pages are only read for their table rows; skip building the rest of the tree
+_TABLES_ONLY = SoupStrainer('table')
+
+# Performance mark with optional "s" suffix and wind reading, e.g. "21.18", "1:55.20", "10.72s (+3.3)"
+_TIME_RE = re.compile(r'\s*(\d+(?:(?::\d+)+(?:\.\d+)?|\.\d+))\s*s?\s*(?:\(.*)?', re.DOTALL)
 
 # National records information
 # Format: "event": {"time": "time_value", "date": "YYYY-MM-DD", "location": "location"}
@@ -60,15 +130,95 @@ FALLBACK_TIMES = {
 # Event display order in README
 EVENT_ORDER = ["60m", "100m", "200m", "300m", "400m", "800m", "1500m"]
 
+# OpenTrack performances table: more than 5 rows, second row holds the "Event"/"Perf" headers
+_OPENTRACK_PERF_TABLE_XPATH = (
+    "//table[count(.//tr) > 5]"
+    "[contains((.//tr)[2], 'Event') and contains((.//tr)[2], 'Perf')]"
+)
+
+
+@lru_cache(maxsize=256)
+def time_to_seconds(time_text: str) -> Optional[float]:
+    """Convert track time text to comparable seconds (memoized; the same marks recur across phases)."""
+    if not time_text:
+        return None
+
+    # Validate the shape up front so unparseable text never reaches float()
+    match = _SECONDS_RE.fullmatch(str(time_text).split('(', 1)[0])
+    if not match:
+        return None
+
+    mins, secs, plain = match.groups()
+    if plain is not None:
+        return float(plain)
+    return float(mins) * 60 + float(secs)
+
+
+# Times within this many seconds of a record count as equalling it (rounding between sources)
+NR_TOLERANCE = 0.01
+
+# Slowest time that still counts as each curated national record, computed once at import
+_NR_CUTOFFS = {event: time_to_seconds(info["time"]) + NR_TOLERANCE for event, info in NATIONAL_RECORDS.items()}
+
+
+def is_national_record(event_key: str, time_val: str, athletics_malta_records: Optional[Dict[str, str]] = None) -> bool:
+    """
+    Check if a time is a national record.
+    
+    Args:
+        event_key: Event key with possible variant (e.g., "200m" or "200m SH")
+        time_val: Time value (e.g., "21.18s")
+        athletics_malta_records: Scraped Athletics Malta records by event, if available
+    
+    Returns:
+        True if time matches a national record
+    """
+    # Extract base event name (e.g., "200m" from "200m SH")
+    base_event = event_key.split(' ', 1)[0]
+    
+    current_time = time_to_seconds(time_val)
+    if current_time is None:
+        return False
+
+    # Check curated records first
+    cutoff = _NR_CUTOFFS.get(base_event)
+    if cutoff is not None and current_time <= cutoff:
+        return True
+
+    # Check Athletics Malta records as additional source
+    athletics_malta_records = athletics_malta_records or {}
+    athletics_record = athletics_malta_records.get(event_key) or athletics_malta_records.get(base_event)
+    if athletics_record:
+        athletics_time = time_to_seconds(athletics_record)
+        if athletics_time is not None and current_time <= athletics_time + NR_TOLERANCE:
+            return True
+
+    return False
+
 
 class AthleteicsDataScraper:
     """Scraper for athletics personal best data from multiple sources."""
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
+        """
+        Args:
+            use_cache: Read the on-disk conditional and render caches; fresh results are still written
+        """
+        self.use_cache = use_cache
         self.session = requests.Session()
         self._world_athletics_records = {}  # Store NR info from World Athletics
         self._athletics_malta_records = {}  # Store official records by event
         self._athletics_malta_positions = {}  # Store athlete all-time position by event
+        # Shared Playwright browser, started lazily on first use (see _fetch_with_playwright)
+        self._pw = None
+        self._browser = None
+        self._playwright_executor: Optional[ThreadPoolExecutor] = None
+        self._playwright_lock = threading.Lock()
+        # Conditional-request cache persisted between runs (see HTTP_CACHE_PATH); always loaded so
+        # that with use_cache=False entries for URLs not fetched this run survive the next write
+        self._http_cache = self._load_http_cache()
+        self._http_cache_lock = threading.Lock()
+        self._page_cache: Dict[str, str] = {}  # HTML fetched this run, keyed by URL
         # Multiple user agents to avoid detection
         self.user_agents = [
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -79,7 +229,6 @@ class AthleteicsDataScraper:
     
     def _setup_session(self):
         """Configure session with headers to avoid bot detection."""
-        import random
         headers = {
             'User-Agent': random.choice(self.user_agents),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -91,12 +240,25 @@ class AthleteicsDataScraper:
             'Cache-Control': 'max-age=0',
         }
         self.session.headers.update(headers)
+        
+        # Pooled keep-alive connections; urllib3 retries transient failures with backoff
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=1.5, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def _fetch_with_playwright(self, url: str) -> Optional[str]:
         """
         Fetch URL using Playwright (handles Cloudflare challenges).
         Uses browser automation to bypass Cloudflare and render dynamic content.
         
+        The browser is launched once and reused for later calls. Playwright's sync API
+        is bound to the thread that started it, so all browser work runs on a single
+        dedicated worker thread, which also serializes concurrent callers.
+        
         Args:
             url: URL to fetch
         
@@ -106,34 +268,16 @@ class AthleteicsDataScraper:
         if not PLAYWRIGHT_AVAILABLE:
             return None
         
+        with self._playwright_lock:
+            if self._playwright_executor is None:
+                self._playwright_executor = ThreadPoolExecutor(max_workers=1)
+            executor = self._playwright_executor
+        
         try:
             print(f"  Using Playwright to bypass Cloudflare...")
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    locale='en-US'
-                )
-                
-                page = context.new_page()
-                page.set_extra_http_headers({
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                })
-                
-                # Navigate and wait for page to be interactive
-                page.goto(url, wait_until='domcontentloaded', timeout=60000)
-                
-                # Wait for JS to render data (5 seconds should be enough for Vue/React)
-                page.wait_for_timeout(5000)
-                
-                content = page.content()
-                context.close()
-                browser.close()
-                
-                if content and len(content) > 500:
-                    return content
+            content = executor.submit(self._render_with_playwright, url).result()
+            if content and len(content) > 500:
+                return content
                     
         except Exception as e:
             error_msg = str(e)[:150]
@@ -144,39 +288,243 @@ class AthleteicsDataScraper:
         
         return None
     
-    def _fetch_with_retry(self, url: str, max_retries: int = 3) -> Optional[requests.Response]:
+    def _ensure_browser(self):
+        """Start Playwright and launch Chromium once (runs on the Playwright thread)."""
+        if self._pw is None:
+            self._pw = sync_playwright().start()
+        if self._browser is None:
+            self._browser = self._pw.chromium.launch(headless=True, args=PLAYWRIGHT_LAUNCH_ARGS)
+    
+    def _render_with_playwright(self, url: str) -> str:
+        """Render a page in a fresh context of the shared browser (runs on the Playwright thread)."""
+        self._ensure_browser()
+        
+        # A new context per fetch is cheap and keeps cookies from leaking between sites
+        context = self._browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            locale='en-US'
+        )
+        try:
+            context.route("**/*", self._block_heavy_resources)
+            page = context.new_page()
+            page.set_extra_http_headers({
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            })
+            
+            # Navigate and wait for page to be interactive
+            page.goto(url, wait_until='domcontentloaded', timeout=60000)
+            
+            # Wait until JS has rendered table rows rather than sleeping a fixed time;
+            # on timeout we still take whatever content has loaded
+            try:
+                page.wait_for_selector('table tr:nth-child(3) td', timeout=15000)
+            except PlaywrightTimeoutError:
+                pass
+            
+            return page.content()
+        finally:
+            context.close()
+    
+    @staticmethod
+    def _block_heavy_resources(route):
+        """Abort images, fonts, stylesheets, media and tracker requests; site scripts still run to render tables."""
+        request = route.request
+        if request.resource_type in PLAYWRIGHT_BLOCKED_RESOURCES or PLAYWRIGHT_BLOCKED_URL_RE.search(request.url):
+            route.abort()
+        else:
+            route.continue_()
+    
+    def _close_playwright(self):
+        """Tear down the shared browser (runs on the Playwright thread)."""
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception:
+                pass
+        if self._pw is not None:
+            try:
+                self._pw.stop()
+            except Exception:
+                pass
+        self._browser = None
+        self._pw = None
+    
+    def close(self):
+        """Release the shared Playwright browser, if one was started."""
+        with self._playwright_lock:
+            executor = self._playwright_executor
+            self._playwright_executor = None
+        
+        if executor is None:
+            return
+        
+        try:
+            executor.submit(self._close_playwright).result()
+        finally:
+            executor.shutdown(wait=True)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _load_http_cache(self) -> Dict[str, Dict]:
+        """Load cached validators and parsed results from disk."""
+        try:
+            return json.loads(HTTP_CACHE_PATH.read_text())
+        except (OSError, ValueError):
+            return {}
+    
+    def _usable_cache_entry(self, url: str) -> Optional[Dict]:
+        """Return the cache entry for url if caching is on and it holds results from the current parser version."""
+        if not self.use_cache:
+            return None
+        
+        entry = self._http_cache.get(url)
+        if not entry or not entry.get('parsed_pbs') or entry.get('version') != HTTP_CACHE_VERSION:
+            return None
+        return entry
+    
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from the cache entry for url."""
+        entry = self._usable_cache_entry(url)
+        if not entry:
+            return {}
+        
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def _cached_entry_if_unchanged(self, url: str, response: requests.Response) -> Optional[Dict]:
+        """
+        Return the cache entry for url if the page has not changed since it was stored.
+        
+        A page is unchanged if the server answered 304 Not Modified, or if the body
+        hashes to the same SHA256 as last time (so re-parsing can be skipped).
+        """
+        entry = self._usable_cache_entry(url)
+        if not entry:
+            return None
+        
+        if response.status_code == 304:
+            return entry
+        if entry.get('body_sha256') == hashlib.sha256(response.content).hexdigest():
+            return entry
+        return None
+    
+    def _store_cache_entry(self, url: str, response: requests.Response, parsed_pbs: Dict[str, str], **extra):
+        """Persist validators, body hash and parsed results for url."""
+        entry = {
+            'version': HTTP_CACHE_VERSION,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body_sha256': hashlib.sha256(response.content).hexdigest(),
+            'parsed_pbs': parsed_pbs,
+            **extra,
+        }
+        with self._http_cache_lock:
+            self._http_cache[url] = entry
+            try:
+                HTTP_CACHE_PATH.write_text(json.dumps(self._http_cache, indent=2))
+            except OSError as e:
+                print(f"  Warning: could not write {HTTP_CACHE_PATH}: {e}")
+    
+    def _render_cache_path(self, url: str) -> Path:
+        """Location of the cached Playwright render for url."""
+        return RENDER_CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.html"
+    
+    def _read_render_cache(self, url: str) -> Optional[str]:
+        """Return the cached Playwright render for url if it is younger than the TTL."""
+        if not self.use_cache:
+            return None
+        
+        try:
+            ttl = int(os.getenv('OPENTRACK_CACHE_TTL', RENDER_CACHE_TTL))
+        except ValueError:
+            ttl = RENDER_CACHE_TTL
+        
+        path = self._render_cache_path(url)
+        try:
+            if time.time() - path.stat().st_mtime < ttl:
+                return path.read_text(encoding='utf-8')
+        except OSError:
+            pass
+        return None
+    
+    def _write_render_cache(self, url: str, content: str):
+        """Store a Playwright render for url."""
+        try:
+            RENDER_CACHE_DIR.mkdir(exist_ok=True)
+            self._render_cache_path(url).write_text(content, encoding='utf-8')
+        except OSError as e:
+            print(f"  Warning: could not write render cache: {e}")
+    
+    def _drop_render_cache(self, url: str):
+        """Delete the cached Playwright render for url, if any."""
+        try:
+            self._render_cache_path(url).unlink(missing_ok=True)
+        except OSError as e:
+            print(f"  Warning: could not remove render cache: {e}")
+    
+    def _cached_get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: int = 20) -> Optional[str]:
         """
-        Fetch URL with retry logic and exponential backoff.
+        GET a page's HTML (decoded as UTF-8), reusing the text of an earlier successful fetch in this run.
         
         Args:
             url: URL to fetch
-            max_retries: Number of retries on failure
+            headers: Per-request headers merged over the session headers
+            timeout: Request timeout in seconds
         
         Returns:
-            Response object or None if all retries failed
+            Page HTML or None if the fetch failed
         """
-        import random
+        html = self._page_cache.get(url)
+        if html is not None:
+            return html
         
-        for attempt in range(max_retries):
-            try:
-                # Rotate user agent
-                self.session.headers['User-Agent'] = random.choice(self.user_agents)
-                
-                # Add random delay to appear more human-like
-                if attempt > 0:
-                    time.sleep(random.uniform(2, 5))
-                
-                response = self.session.get(url, timeout=15)
-                response.raise_for_status()
-                return response
-            except requests.exceptions.RequestException as e:
-                print(f"  Attempt {attempt + 1} failed: {str(e)[:100]}")
-                if attempt == max_retries - 1:
-                    print(f"  Failed to fetch {url} after {max_retries} attempts")
-                    return None
+        try:
+            response = self.session.get(url, timeout=timeout, headers=headers)
+        except requests.RequestException:
+            return None
         
+        if response.status_code == 200 and response.content:
+            # Decode once as UTF-8 rather than letting requests guess a missing charset
+            html = response.content.decode('utf-8', errors='replace')
+            self._page_cache[url] = html
+            return html
         return None
     
+    def _fetch_with_retry(self, url: str, conditional: bool = False) -> Optional[requests.Response]:
+        """
+        Fetch URL; retries with exponential backoff are handled by the session adapter.
+        
+        Args:
+            url: URL to fetch
+            conditional: Send cached validators so the server may answer 304 Not Modified
+        
+        Returns:
+            Response object (possibly a 304) or None if all retries failed
+        """
+        # Rotate user agent per request; the shared session headers are left
+        # untouched so concurrent fetches from other threads don't race on them
+        headers = {'User-Agent': random.choice(self.user_agents)}
+        if conditional:
+            headers.update(self._conditional_headers(url))
+        
+        try:
+            response = self.session.get(url, timeout=15, headers=headers)
+            response.raise_for_status()
+            return response
+        except requests.exceptions.RequestException as e:
+            print(f"  Failed to fetch {url}: {str(e)[:100]}")
+            return None
+    
     def parse_time(self, time_text: str) -> Optional[str]:
         """
         Parse a time string, handling wind readings and formatting.
@@ -190,25 +538,19 @@ class AthleteicsDataScraper:
         if not time_text or not isinstance(time_text, str):
             return None
         
-        # Remove wind reading and extra whitespace
-        time_clean = time_text.split('(')[0].strip()
-        
-        # Handle time format variations
-        if time_clean:
-            # Check for valid time format
-            components = time_clean.replace(":", ".").split(".")
-            if len(components) >= 2:
-                try:
-                    # Try to parse as a number
-                    float(time_clean.replace(":", ""))
-                    if not time_clean.endswith("s"):
-                        time_clean += "s"
-                    return time_clean
-                except (ValueError, AttributeError):
-                    pass
+        # One match both validates the mark and drops any wind reading; the common
+        # non-performance row is rejected without raising an exception
+        match = _TIME_RE.fullmatch(time_text)
+        if match:
+            return match.group(1) + "s"
         
         return None
     
+    @staticmethod
+    def _cell_text(cell) -> str:
+        """Text of an lxml table cell with each text node stripped (like BeautifulSoup's get_text(strip=True))."""
+        return ''.join(text.strip() for text in cell.itertext())
+    
     def scrape_opentrack(self) -> Dict[str, str]:
         """
         Scrape personal best times from OpenTrack website.
@@ -217,6 +559,9 @@ class AthleteicsDataScraper:
         If scraping fails, checks for OPENTRACK_PBS environment variable with JSON-encoded times.
         Example: OPENTRACK_PBS='{"200m": "21.18s", "200m SH": "21.83s"}'
         
+        Playwright renders that yield times are cached in .pb_cache/ for OPENTRACK_CACHE_TTL seconds
+        (default 6 hours); a cached render that no longer parses is discarded.
+        
         Returns:
             Dict with format: "event_variant": "time" (e.g., {"100m": "10.72s", "200m SH": "20.50s"})
         """
@@ -227,22 +572,44 @@ class AthleteicsDataScraper:
         env_times = os.getenv('OPENTRACK_PBS')
         if env_times:
             try:
-                pbs = json.loads(env_times)
-                print(f"  Loaded {len(pbs)} times from OPENTRACK_PBS environment variable")
-                return pbs
+                decoded = json.loads(env_times)
             except json.JSONDecodeError:
+                decoded = None
                 print(f"  Warning: OPENTRACK_PBS is invalid JSON, attempting web scrape...")
+            
+            if decoded is not None and not isinstance(decoded, dict):
+                print(f"  Warning: OPENTRACK_PBS must be a JSON object of event -> time, attempting web scrape...")
+            elif decoded is not None:
+                # Keep only plain times (strings or numbers); anything else would break time parsing later
+                pbs = {
+                    event: str(time_val)
+                    for event, time_val in decoded.items()
+                    if isinstance(time_val, (str, int, float)) and not isinstance(time_val, bool)
+                }
+                if len(pbs) < len(decoded):
+                    print(f"  Warning: ignored {len(decoded) - len(pbs)} OPENTRACK_PBS entries that are not times")
+                print(f"  Loaded {len(pbs)} times from OPENTRACK_PBS environment variable")
+                # Explicit times supersede any cached render of the page
+                self._drop_render_cache(OPENTRACK_URL)
+                return pbs
         
         # First try with requests
-        response = self._fetch_with_retry(OPENTRACK_URL)
+        response = self._fetch_with_retry(OPENTRACK_URL, conditional=True)
+        
+        # Where a Playwright render came from; it is only cached once it parses to times
+        cached_render = fresh_render = False
         
         # If requests fails, try Playwright to bypass Cloudflare
         if not response:
             if PLAYWRIGHT_AVAILABLE:
-                content = self._fetch_with_playwright(OPENTRACK_URL)
+                content = self._read_render_cache(OPENTRACK_URL)
                 if content:
-                    soup = BeautifulSoup(content, 'html.parser')
+                    print("  Using cached Playwright render of OpenTrack")
+                    cached_render = True
                 else:
+                    content = self._fetch_with_playwright(OPENTRACK_URL)
+                    fresh_render = bool(content)
+                if not content:
                     print("  Both requests and Playwright failed")
                     print("  Tip: Set OPENTRACK_PBS environment variable with your times")
                     print("  Example: OPENTRACK_PBS='{\"200m\": \"21.18s\", \"200m SH\": \"21.83s\"}'")
@@ -254,73 +621,70 @@ class AthleteicsDataScraper:
                 print("  Example: OPENTRACK_PBS='{\"200m\": \"21.18s\", \"200m SH\": \"21.83s\"}'")
                 return {}
         else:
-            soup = BeautifulSoup(response.content, 'html.parser')
+            cached = self._cached_entry_if_unchanged(OPENTRACK_URL, response)
+            if cached:
+                print("  OpenTrack page unchanged since last run, using cached times")
+                return dict(cached['parsed_pbs'])
+            content = response.content
         
         try:
-            # Look for performance tables in the page
-            tables = soup.find_all('table')
-            print(f"  Found {len(tables)} tables")
-            
-            # Find the Performances table by looking for one with events
-            perf_table = None
-            for table in tables:
-                rows = table.find_all('tr')
-                if len(rows) > 5:
-                    # Check if second row has "Event" and "Perf" headers
-                    if len(rows) > 1:
-                        second_header = rows[1].get_text(strip=True)
-                        if 'Event' in second_header and 'Perf' in second_header:
-                            perf_table = table
-                            break
+            # lxml's C parser + XPath finds the performances table in one pass
+            tree = lxml.html.fromstring(content, parser=lxml.html.HTMLParser(collect_ids=False))
+            print(f"  Found {int(tree.xpath('count(//table)'))} tables")
             
-            if not perf_table:
+            perf_tables = tree.xpath(_OPENTRACK_PERF_TABLE_XPATH)
+            if not perf_tables:
                 print("  No performances table found")
+                if cached_render:
+                    # e.g. a cached challenge page; render afresh next run instead of for the whole TTL
+                    self._drop_render_cache(OPENTRACK_URL)
                 return {}
+            perf_table = perf_tables[0]
             
             # Extract performance data
-            rows = perf_table.find_all('tr')
-            for row_idx, row in enumerate(rows[2:]):  # Skip header rows (0=year, 1=headers)
-                cells = row.find_all(['td', 'th'])
+            # event_key -> (seconds, display time); each mark is parsed exactly once
+            best: Dict[str, Tuple[Optional[float], str]] = {}
+            rows = perf_table.xpath('.//tr')
+            for row in rows[2:]:  # Skip header rows (0=year, 1=headers)
+                # Direct child iteration; no per-row XPath evaluation
+                cells = list(row.iterchildren('td', 'th'))
                 if len(cells) < 2:
                     continue
                 
-                event_text = cells[0].get_text(strip=True)
-                perf_text = cells[1].get_text(strip=True) if len(cells) > 1 else ""
-                
-                # Check if this is an event row (event codes are just numbers or have short track/indoor indicators)
-                if not perf_text or not self.parse_time(perf_text):
-                    continue  # Skip non-performance rows
-                
-                # Parse event name
-                event_key = None
-                for dist in TARGET_EVENTS:
-                    if event_text.strip() == dist:
-                        event_key = f"{dist}m"
-                        break
-                
-                if not event_key or not perf_text:
+                # Parse event name (OpenTrack event codes are bare distances, e.g. "200");
+                # rows for other events are dropped before their performance cell is read
+                event_key = _OPENTRACK_EVENT_KEYS.get(self._cell_text(cells[0]))
+                if not event_key:
                     continue
                 
-                # Parse time (format: "21.18 (+1.3)" or "21.18")
-                time_value = self.parse_time(perf_text)
+                # Parse time (format: "21.18 (+1.3)" or "21.18"); skips non-performance rows
+                time_value = self.parse_time(self._cell_text(cells[1]))
                 if time_value:
                     # Keep best time if we already have this event
-                    if event_key in pbs:
-                        try:
-                            existing = float(pbs[event_key].replace('s', ''))
-                            new = float(time_value.replace('s', ''))
-                            if new < existing:
-                                pbs[event_key] = time_value
-                        except ValueError:
-                            pass
+                    new = self._time_to_seconds(time_value)
+                    if event_key in best:
+                        existing = best[event_key][0]
+                        if existing is not None and new is not None and new < existing:
+                            best[event_key] = (new, time_value)
                     else:
-                        pbs[event_key] = time_value
+                        best[event_key] = (new, time_value)
                         print(f"  Found: {event_key} -> {time_value}")
             
+            pbs = {event_key: time_value for event_key, (_, time_value) in best.items()}
+            
+            if response and pbs:
+                self._store_cache_entry(OPENTRACK_URL, response, pbs)
+            elif fresh_render and pbs:
+                self._write_render_cache(OPENTRACK_URL, content)
+            elif cached_render and not pbs:
+                self._drop_render_cache(OPENTRACK_URL)
+            
             return pbs
             
         except Exception as e:
             print(f"  Error parsing OpenTrack response: {e}")
+            if cached_render:
+                self._drop_render_cache(OPENTRACK_URL)
             return {}
     
     def scrape_world_athletics(self) -> Dict[str, str]:
@@ -334,131 +698,156 @@ class AthleteicsDataScraper:
         print("Scraping World Athletics...")
         pbs = {}
         
-        response = self._fetch_with_retry(WORLD_ATHLETICS_URL)
+        response = self._fetch_with_retry(WORLD_ATHLETICS_URL, conditional=True)
         if not response:
             print("  Could not fetch World Athletics page")
             return {}
         
+        cached = self._cached_entry_if_unchanged(WORLD_ATHLETICS_URL, response)
+        if cached:
+            print("  World Athletics page unchanged since last run, using cached times")
+            for event_key in cached.get('nr_events', []):
+                self._world_athletics_records[event_key] = True
+            return dict(cached['parsed_pbs'])
+        
         try:
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # lxml's C tree is far smaller than a BeautifulSoup tree for this large page
+            tree = lxml.html.fromstring(response.content, parser=lxml.html.HTMLParser(collect_ids=False))
             
-            # Find the script tag containing Next.js data with competitor info
-            scripts = soup.find_all('script')
-            for script in scripts:
-                if script.string and 'singleCompetitor' in script.string:
-                    try:
-                        content = script.string
-                        # Extract JSON object
-                        start = content.find('{')
-                        end = content.rfind('}') + 1
-                        
-                        if start != -1 and end > start:
-                            json_str = content[start:end]
-                            data = json.loads(json_str)
-                            
-                            # Navigate to personal bests
-                            competitor = data.get('props', {}).get('pageProps', {}).get('competitor', {})
-                            personal_bests = competitor.get('personalBests', {})
-                            results = personal_bests.get('results', [])
-                            
-                            print(f"  Found {len(results)} events in personal bests")
-                            
-                            for result in results:
-                                try:
-                                    mark = result.get('mark', '')
-                                    discipline = result.get('discipline', '')
-                                    records = result.get('records', [])
-                                    
-                                    if not mark or not discipline:
-                                        continue
-                                    
-                                    # Parse event name and detect variant
-                                    event_key = self._parse_world_athletics_event(discipline)
-                                    if not event_key:
-                                        continue
-                                    
-                                    # Format time with 's' suffix
-                                    time_value = mark + 's' if mark and not mark.endswith('s') else mark
-                                    
-                                    pbs[event_key] = time_value
-                                    
-                                    # Log if it's a national record
-                                    if 'NR' in records:
-                                        self._world_athletics_records[event_key] = True
-                                        print(f"  {event_key} -> {time_value} [NR]")
-                                    else:
-                                        print(f"  {event_key} -> {time_value}")
-                                        
-                                except (ValueError, KeyError):
-                                    continue
-                            
-                            return pbs
-                            
-                    except json.JSONDecodeError:
+            data = self._find_world_athletics_data(tree)
+            if data is None:
+                print("  Could not find athlete data in page scripts")
+                return {}
+            
+            # Navigate to personal bests
+            competitor = data.get('props', {}).get('pageProps', {}).get('competitor', {})
+            personal_bests = competitor.get('personalBests', {})
+            results = personal_bests.get('results', [])
+            
+            print(f"  Found {len(results)} events in personal bests")
+            
+            for result in results:
+                try:
+                    mark = result.get('mark', '')
+                    discipline = result.get('discipline', '')
+                    records = result.get('records', [])
+                    
+                    if not mark or not discipline:
                         continue
-                    except Exception as e:
-                        print(f"  Error parsing World Athletics data: {e}")
+                    
+                    # Parse event name and detect variant
+                    event_key = self._parse_world_athletics_event(discipline)
+                    if not event_key:
                         continue
+                    
+                    # Format time with 's' suffix
+                    time_value = mark + 's' if mark and not mark.endswith('s') else mark
+                    
+                    pbs[event_key] = time_value
+                    
+                    # Log if it's a national record
+                    if 'NR' in records:
+                        self._world_athletics_records[event_key] = True
+                        print(f"  {event_key} -> {time_value} [NR]")
+                    else:
+                        print(f"  {event_key} -> {time_value}")
+                        
+                except (ValueError, KeyError):
+                    continue
             
-            print("  Could not find athlete data in page scripts")
-            return {}
+            if pbs:
+                nr_events = [k for k in pbs if k in self._world_athletics_records]
+                self._store_cache_entry(WORLD_ATHLETICS_URL, response, pbs, nr_events=nr_events)
+            
+            return pbs
             
         except Exception as e:
             print(f"  Error scraping World Athletics: {e}")
             return {}
+    
+    def _find_world_athletics_data(self, tree: lxml.html.HtmlElement) -> Optional[Dict]:
+        """
+        Locate and decode the Next.js page data embedded in a World Athletics athlete page.
+        
+        Args:
+            tree: Parsed athlete page
+        
+        Returns:
+            Decoded page data or None if it could not be found
+        """
+        # Next.js ships page data as a pure JSON document in a single tagged script
+        tag = tree.find('.//script[@id="__NEXT_DATA__"]')
+        if tag is not None and tag.text:
+            try:
+                return json_loads(tag.text)
+            except json.JSONDecodeError:
+                pass
+        
+        # Fallback: scan all scripts for the competitor payload and frame the JSON object
+        for script in tree.iter('script'):
+            content = script.text
+            if content and 'singleCompetitor' in content:
+                start = content.find('{')
+                end = content.rfind('}') + 1
+                
+                if start != -1 and end > start:
+                    try:
+                        return json_loads(content[start:end])
+                    except json.JSONDecodeError:
+                        continue
+        
+        return None
 
+    def scrape_all(self) -> Dict[str, Dict[str, str]]:
+        """
+        Run the OpenTrack, World Athletics and Athletics Malta records scrapes concurrently.
+        
+        The scrapes are independent and network-bound, so wall time is that of the
+        slowest one. Each writes only its own instance attribute, so no locking is needed.
+        
+        Returns:
+            Dict with "opentrack", "world_athletics" and "athletics_malta" results
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                executor.submit(self.scrape_opentrack): 'opentrack',
+                executor.submit(self.scrape_world_athletics): 'world_athletics',
+                executor.submit(self.scrape_athletics_malta_records): 'athletics_malta',
+            }
+            return {futures[future]: future.result() for future in as_completed(futures)}
+    
     def _event_from_athletics_malta(self, event_name: str) -> Optional[str]:
         """Normalize Athletics Malta event names to tracker event keys."""
-        text = (event_name or "").strip().lower()
+        text = (event_name or "").strip()
 
         if not text:
             return None
 
-        if 'relay' in text or 'hurdle' in text or 'walk' in text:
+        if _AM_EXCLUDED_RE.search(text):
             return None
 
-        match = re.match(r'^(\d+)\s*x\s*\d+m$', text)
+        match = _RELAY_XM_RE.match(text)
         if match:
             return None
 
-        match = re.match(r'^(\d+)\s*m(?:etres?)?$', text)
+        match = _AM_METRES_RE.match(text)
         if not match:
             return None
 
         dist = match.group(1)
-        if dist not in TARGET_EVENTS:
+        if dist not in TARGET_EVENTS_SET:
             return None
 
         event_key = f"{dist}m"
-        if 'short track' in text or 'indoor' in text:
+        if _SHORT_TRACK_RE.search(text) or _INDOOR_RE.search(text):
             event_key += " SH"
 
         return event_key
 
     def _time_to_seconds(self, time_text: str) -> Optional[float]:
         """Convert track time text to comparable seconds."""
-        if not time_text:
-            return None
-
-        clean = str(time_text).split('(')[0].strip().replace('s', '')
-        if not clean:
-            return None
-
-        try:
-            if ':' in clean:
-                mins, secs = clean.split(':', 1)
-                return float(mins) * 60 + float(secs)
-
-            parts = clean.split('.')
-            if len(parts) == 2:
-                return float(clean)
-
-            if len(parts) == 3 and parts[0].isdigit() and parts[1].isdigit() and parts[2].isdigit():
-                return float(parts[0]) * 60 + float(f"{parts[1]}.{parts[2]}")
-
-            return float(clean)
-        except ValueError:
-            return None
+        # The memoized parser needs a hashable key; coerce whatever a source handed us
+        return time_to_seconds(str(time_text)) if time_text is not None else None
 
     def scrape_athletics_malta_records(self) -> Dict[str, str]:
         """Scrape Athletics Malta records and keep best (fastest) time per event."""
@@ -471,37 +860,38 @@ class AthleteicsDataScraper:
         records: Dict[str, str] = {}
 
         for url in urls_to_try:
-            # First attempt: plain one-off request (sometimes less likely to be challenged)
-            try:
-                plain_response = requests.get(
-                    url,
-                    timeout=20,
-                    headers={
-                        'User-Agent': random.choice(self.user_agents),
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                        'Accept-Language': 'en-US,en;q=0.9',
-                        'Referer': 'https://athleticsmalta.com/',
-                    },
-                )
-                if plain_response.status_code == 200 and plain_response.text:
-                    try:
-                        soup = BeautifulSoup(plain_response.content, 'html.parser')
-                        records = self._parse_athletics_malta_records_soup(soup)
-                        if records:
-                            self._athletics_malta_records = records
-                            print(f"  Found {len(records)} events from Athletics Malta records")
-                            return records
-                    except Exception:
-                        pass
-            except requests.RequestException:
-                pass
+            # First attempt: single request with site-specific headers (sometimes less likely
+            # to be challenged), or the page already fetched earlier in this run
+            html = self._cached_get(
+                url,
+                headers={
+                    'User-Agent': random.choice(self.user_agents),
+                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                    'Accept-Language': 'en-US,en;q=0.9',
+                    'Referer': 'https://athleticsmalta.com/',
+                },
+            )
+            if html:
+                try:
+                    soup = BeautifulSoup(html, 'lxml', parse_only=_TABLES_ONLY)
+                    records = self._parse_athletics_malta_records_soup(soup)
+                    if records:
+                        self._athletics_malta_records = records
+                        print(f"  Found {len(records)} events from Athletics Malta records")
+                        return records
+                except Exception:
+                    pass
 
             response = self._fetch_with_retry(url)
             if response:
                 try:
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    # Athletics Malta serves UTF-8; decoding once skips BeautifulSoup's
+                    # encoding detection and requests' charset guessing
+                    html = response.content.decode('utf-8', errors='replace')
+                    soup = BeautifulSoup(html, 'lxml', parse_only=_TABLES_ONLY)
                     records = self._parse_athletics_malta_records_soup(soup)
                     if records:
+                        self._page_cache[url] = html
                         self._athletics_malta_records = records
                         print(f"  Found {len(records)} events from Athletics Malta records")
                         return records
@@ -512,9 +902,10 @@ class AthleteicsDataScraper:
                 content = self._fetch_with_playwright(url)
                 if content:
                     try:
-                        soup = BeautifulSoup(content, 'html.parser')
+                        soup = BeautifulSoup(content, 'lxml', parse_only=_TABLES_ONLY)
                         records = self._parse_athletics_malta_records_soup(soup)
                         if records:
+                            self._page_cache[url] = content
                             self._athletics_malta_records = records
                             print(f"  Found {len(records)} events from Athletics Malta records")
                             return records
@@ -531,7 +922,7 @@ class AthleteicsDataScraper:
         rows = soup.find_all('tr')
 
         for row in rows:
-            cells = row.find_all('td')
+            cells = row.find_all('td', recursive=False)
             if len(cells) < 4:
                 continue
 
@@ -560,6 +951,9 @@ class AthleteicsDataScraper:
         """
         Fetch athlete all-time positions from Athletics Malta filtered rankings.
 
+        Events are looked up concurrently (at most ATHLETICS_MALTA_MAX_WORKERS at a time),
+        each worker pausing briefly after its request to keep per-host pacing gentle.
+
         Args:
             events: Event keys currently in merged PBs
             athlete_name: Athlete full name to match in table rows
@@ -570,76 +964,73 @@ class AthleteicsDataScraper:
         print("Scraping Athletics Malta positions...")
         positions: Dict[str, int] = {}
 
-        for event_key in sorted(events.keys()):
-            base_event = event_key.split()[0]
-            if not re.match(r'^\d+m$', base_event):
-                continue
-
-            game_type = "Indoor" if (" SH" in event_key or " IN" in event_key) else "Outdoor"
-            params = {
-                "sf_data": "results",
-                "_sfm_gender": "Men",
-                "_sfm_age_group": "Senior",
-                "_sfm_game_type": game_type,
-                "_sfm_event_type": base_event,
-            }
-            query_url = f"{ATHLETICS_MALTA_RECORDS_URL}?{urlencode(params)}"
-
-            html = None
-            try:
-                response = requests.get(
-                    query_url,
-                    timeout=20,
-                    headers={
-                        'User-Agent': 'Mozilla/5.0',
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                        'Accept-Language': 'en-US,en;q=0.9',
-                        'Referer': 'https://athleticsmalta.com/records/',
-                    },
-                )
-                if response.status_code == 200 and response.text:
-                    html = response.text
-            except requests.RequestException:
-                pass
+        event_keys = [k for k in sorted(events.keys()) if _EVENT_KEY_RE.match(k.split()[0])]
+        if event_keys:
+            with ThreadPoolExecutor(max_workers=ATHLETICS_MALTA_MAX_WORKERS) as executor:
+                ranks = executor.map(lambda k: self._fetch_athletics_malta_position(k, athlete_name), event_keys)
+                for event_key, rank in zip(event_keys, ranks):
+                    if rank is not None:
+                        positions[event_key] = rank
 
-            if not html:
-                continue
+        self._athletics_malta_positions = positions
+        print(f"  Found {len(positions)} event positions for {athlete_name}")
+        return positions
 
-            try:
-                soup = BeautifulSoup(html, 'html.parser')
-                rows = soup.find_all('tr')
-                found_rank = None
-                for row in rows:
-                    cells = row.find_all('td')
-                    if len(cells) < 9:
-                        continue
+    def _fetch_athletics_malta_position(self, event_key: str, athlete_name: str) -> Optional[int]:
+        """Look up the athlete's all-time rank for one event, or None if not found."""
+        base_event = event_key.split()[0]
+        game_type = "Indoor" if (" SH" in event_key or " IN" in event_key) else "Outdoor"
+        params = {
+            "sf_data": "results",
+            "_sfm_gender": "Men",
+            "_sfm_age_group": "Senior",
+            "_sfm_game_type": game_type,
+            "_sfm_event_type": base_event,
+        }
+        query_url = f"{ATHLETICS_MALTA_RECORDS_URL}?{urlencode(params)}"
+
+        html = self._cached_get(
+            query_url,
+            headers={
+                'User-Agent': 'Mozilla/5.0',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Referer': 'https://athleticsmalta.com/records/',
+            },
+        )
+        if not html:
+            return None
 
-                    rank_text = cells[0].get_text(strip=True)
-                    athlete_text = cells[2].get_text(strip=True)
-                    event_text = cells[3].get_text(strip=True)
+        found_rank = None
+        athlete_lower = athlete_name.lower()
+        event_lower = base_event.lower()
+        try:
+            soup = BeautifulSoup(html, 'lxml', parse_only=_TABLES_ONLY)
+            rows = soup.find_all('tr')
+            for row in rows:
+                cells = row.find_all('td', recursive=False)
+                if len(cells) < 9:
+                    continue
 
-                    if athlete_name.lower() not in athlete_text.lower():
-                        continue
+                # Reject other athletes' rows before reading any other cell
+                if athlete_lower not in cells[2].get_text(strip=True).lower():
+                    continue
 
-                    if event_text.strip().lower() != base_event.lower():
-                        continue
+                if cells[3].get_text(strip=True).lower() != event_lower:
+                    continue
 
-                    if rank_text.isdigit():
-                        found_rank = int(rank_text)
-                        break
+                rank_text = cells[0].get_text(strip=True)
+                if rank_text.isdigit():
+                    found_rank = int(rank_text)
+                    break
+        except Exception:
+            return None
 
-                if found_rank is not None:
-                    positions[event_key] = found_rank
-            except Exception:
-                continue
+        # Gentle pacing to avoid triggering anti-bot/rate-limit rules
+        time.sleep(0.4)
 
-            # Gentle pacing to avoid triggering anti-bot/rate-limit rules
-            time.sleep(0.4)
+        return found_rank
 
-        self._athletics_malta_positions = positions
-        print(f"  Found {len(positions)} event positions for {athlete_name}")
-        return positions
-    
     def _parse_world_athletics_event(self, discipline: str) -> Optional[str]:
         """
         Parse World Athletics discipline name into event key format.
@@ -656,105 +1047,76 @@ class AthleteicsDataScraper:
         Returns:
             Formatted event key or None if not a target event
         """
-        discipline_lower = discipline.lower()
-        
         # Skip relay events
-        if 'relay' in discipline_lower:
+        if _RELAY_RE.search(discipline):
             return None
         
-        # Extract distance (60, 100, 200, 300, 400, 800, 1500, etc)
-        for dist in TARGET_EVENTS:
-            if f"{dist} metre" in discipline_lower:
-                event_key = f"{dist}m"
-                
-                # Detect variant indicators
-                if 'short track' in discipline_lower:
-                    event_key += " SH"
-                elif 'indoor' in discipline_lower:
-                    event_key += " IN"
-                
-                return event_key
-        
-        # Check for longer distances not in TARGET_EVENTS
-        match = re.search(r'(\d+)\s*(?:metre|meter)', discipline_lower)
+        # Extract distance (60, 100, ... 1500, and longer distances not in TARGET_EVENTS)
+        match = _METRES_RE.search(discipline)
         if match:
             dist = match.group(1)
             event_key = f"{dist}m"
             
-            if 'short track' in discipline_lower:
+            # Detect variant indicators
+            if _SHORT_TRACK_RE.search(discipline):
                 event_key += " SH"
-            elif 'indoor' in discipline_lower:
+            elif _INDOOR_RE.search(discipline):
                 event_key += " IN"
             
             return event_key
         
         return None
     
-    def merge_times(self, opentrack_pbs: Dict, world_pbs: Dict) -> Dict:
+    def merge_times(self, *sources: Dict[str, str]) -> Dict[str, str]:
         """
         Merge times from multiple sources, keeping the best (fastest) for each event variant.
         
         Args:
-            opentrack_pbs: Times from OpenTrack (flat dict with event variants as keys)
-            world_pbs: Times from World Athletics (flat dict with event variants as keys)
+            *sources: Flat dicts of times with event variants as keys (e.g., OpenTrack,
+                World Athletics, FALLBACK_TIMES); on ties the earlier source wins
         
         Returns:
             Merged dictionary with best times for each event variant
         """
-        merged = {}
+        # event_key -> (seconds, display time); each time is parsed exactly once
+        best: Dict[str, Tuple[Optional[float], str]] = {}
         
-        # Process both sources
-        for source_pbs in [opentrack_pbs, world_pbs]:
+        for source_pbs in sources:
             for event_key, time_val in source_pbs.items():
-                if event_key not in merged:
-                    merged[event_key] = time_val
+                new = self._time_to_seconds(time_val)
+                if event_key not in best:
+                    best[event_key] = (new, time_val)
                 else:
                     # Keep the faster time
-                    try:
-                        current = float(merged[event_key].replace('s', ''))
-                        new = float(time_val.replace('s', ''))
-                        if new < current:
-                            merged[event_key] = time_val
-                    except (ValueError, AttributeError):
-                        pass
+                    current = best[event_key][0]
+                    if current is not None and new is not None and new < current:
+                        best[event_key] = (new, time_val)
         
-        return merged
+        return {event_key: time_val for event_key, (_, time_val) in best.items()}
     
     def is_national_record(self, event_key: str, time_val: str) -> bool:
-        """
-        Check if a time is a national record.
-        
-        Args:
-            event_key: Event key with possible variant (e.g., "200m" or "200m SH")
-            time_val: Time value (e.g., "21.18s")
-        
-        Returns:
-            True if time matches a national record
-        """
-        # Extract base event name (e.g., "200m" from "200m SH")
-        base_event = event_key.split()[0] if ' ' in event_key else event_key
-        
-        current_time = self._time_to_seconds(time_val)
-        if current_time is None:
-            return False
+        """Check a time against curated and scraped Athletics Malta national records."""
+        return is_national_record(event_key, time_val, self._athletics_malta_records)
 
-        # Check curated records first
-        if base_event in NATIONAL_RECORDS:
-            try:
-                curated_time = self._time_to_seconds(NATIONAL_RECORDS[base_event]["time"])
-                if curated_time is not None and current_time <= curated_time + 0.01:
-                    return True
-            except (ValueError, KeyError):
-                pass
 
-        # Check Athletics Malta records as additional source
-        athletics_record = self._athletics_malta_records.get(event_key) or self._athletics_malta_records.get(base_event)
-        if athletics_record:
-            athletics_time = self._time_to_seconds(athletics_record)
-            if athletics_time is not None and current_time <= athletics_time + 0.01:
-                return True
+def _format_ordinal(rank: int) -> str:
+    """Format a rank with its English ordinal suffix (e.g., 1 -> "1st", 12 -> "12th")."""
+    if 10 <= rank % 100 <= 20:
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(rank % 10, "th")
+    return f"{rank}{suffix}"
 
-        return False
+
+# Ordinals for every realistic all-time rank, built once at import
+_ORDINALS = [_format_ordinal(rank) for rank in range(200)]
+
+
+def ordinal(rank: int) -> str:
+    """Ordinal string for a rank, from the prebuilt table when in range."""
+    if 0 <= rank < len(_ORDINALS):
+        return _ORDINALS[rank]
+    return _format_ordinal(rank)
 
 
 def build_widget(pbs: Dict[str, str], world_athletics_records: Dict = None, scraper: Optional[AthleteicsDataScraper] = None) -> str:
@@ -764,6 +1126,7 @@ def build_widget(pbs: Dict[str, str], world_athletics_records: Dict = None, scra
     Args:
         pbs (dict): Personal bests with event variants as keys (e.g., {"100m": "10.72s", "200m SH": "20.50s"})
         world_athletics_records (dict): Event keys that are marked as NR by World Athletics
+        scraper (AthleteicsDataScraper): Scraper holding Athletics Malta records/positions, if any
     
     Returns:
         str: Formatted markdown table for README
@@ -771,63 +1134,53 @@ def build_widget(pbs: Dict[str, str], world_athletics_records: Dict = None, scra
     if world_athletics_records is None:
         world_athletics_records = {}
 
-    def ordinal(rank: int) -> str:
-        if 10 <= rank % 100 <= 20:
-            suffix = "th"
-        else:
-            suffix = {1: "st", 2: "nd", 3: "rd"}.get(rank % 10, "th")
-        return f"{rank}{suffix}"
-    
     lines = []
     lines.append("### 🏃 Automatic Personal Best Tracker\n")
     lines.append("| Event | PB | Status |")
     lines.append("|-------|------|--------|")
     
-    if scraper is None:
-        scraper = AthleteicsDataScraper()
-    displayed_events = set()
+    # Read scraped Athletics Malta data from the scraper that ran; no scraper means none
+    athletics_malta_records = scraper._athletics_malta_records if scraper else {}
+    positions = scraper._athletics_malta_positions if scraper else {}
+    
+    # NR status per event, from confirmed records and World Athletics records
+    nr_map = {
+        event_key: is_national_record(event_key, time_val, athletics_malta_records) or (event_key in world_athletics_records)
+        for event_key, time_val in pbs.items()
+    }
+    
+    def row(event_key: str) -> str:
+        time_val = pbs[event_key]
+        if nr_map[event_key]:
+            status = "🔴 NR"
+        else:
+            rank = positions.get(event_key)
+            status = f"{ordinal(rank)} All-Time" if rank else "-"
+        return f"| {event_key} | {time_val} | {status} |"
+    
+    # Group keys by base event once (e.g., "200m" -> ["200m", "200m SH"])
+    by_base: Dict[str, list] = {}
+    for event_key in pbs:
+        by_base.setdefault(event_key.split(' ', 1)[0], []).append(event_key)
     
     # First pass: Add events in preferred order
     for event in EVENT_ORDER:
+        group = by_base.pop(event, None)
+        if not group:
+            continue
+        
         # Add base event
-        if event in pbs and event not in displayed_events:
-            time_val = pbs[event]
-            # Check both confirmed records and World Athletics records
-            is_nr = scraper.is_national_record(event, time_val) or (event in world_athletics_records)
-            if is_nr:
-                status = "🔴 NR"
-            else:
-                rank = getattr(scraper, '_athletics_malta_positions', {}).get(event)
-                status = f"{ordinal(rank)} All-Time" if rank else "-"
-            lines.append(f"| {event} | {time_val} | {status} |")
-            displayed_events.add(event)
+        if event in pbs:
+            lines.append(row(event))
         
         # Add any variants of this event (e.g., "200m SH", "200m IN")
-        for event_key in sorted(pbs.keys()):
-            if event_key.startswith(event + " ") and event_key not in displayed_events:
-                time_val = pbs[event_key]
-                # Check both confirmed records and World Athletics records
-                is_nr = scraper.is_national_record(event_key, time_val) or (event_key in world_athletics_records)
-                if is_nr:
-                    status = "🔴 NR"
-                else:
-                    rank = getattr(scraper, '_athletics_malta_positions', {}).get(event_key)
-                    status = f"{ordinal(rank)} All-Time" if rank else "-"
-                lines.append(f"| {event_key} | {time_val} | {status} |")
-                displayed_events.add(event_key)
+        for event_key in sorted(group):
+            if event_key != event:
+                lines.append(row(event_key))
     
     # Second pass: Add any remaining events not in standard order
-    for event_key in sorted(pbs.keys()):
-        if event_key not in displayed_events:
-            time_val = pbs[event_key]
-            is_nr = scraper.is_national_record(event_key, time_val) or (event_key in world_athletics_records)
-            if is_nr:
-                status = "🔴 NR"
-            else:
-                rank = getattr(scraper, '_athletics_malta_positions', {}).get(event_key)
-                status = f"{ordinal(rank)} All-Time" if rank else "-"
-            lines.append(f"| {event_key} | {time_val} | {status} |")
-            displayed_events.add(event_key)
+    for event_key in sorted(k for group in by_base.values() for k in group):
+        lines.append(row(event_key))
     
     lines.append("\n> _Last updated: " + datetime.now().strftime("%d %B %Y") + "_")
     lines.append("\n> _Sourced from [OpenTrack](https://malta.opentrack.run/), [World Athletics](https://worldathletics.org/) & [Athletics Malta Records](https://athleticsmalta.com/records/)_")
@@ -847,11 +1200,15 @@ def update_readme(widget_content: str, readme_path: Path = Path("README.md")):
         print(f"ERROR: {readme_path} not found.")
         return False
     
-    content = readme_path.read_text()
+    content = readme_path.read_text(encoding='utf-8')
     start_tag = "<!-- START_PB -->"
     end_tag = "<!-- END_PB -->"
     
-    if start_tag not in content or end_tag not in content:
+    # Partition around the tags: one scan each, and only the surrounding text is copied
+    before, found_start, rest = content.partition(start_tag)
+    _, found_end, after = rest.partition(end_tag)
+    
+    if not found_start or not found_end:
         print(f"ERROR: START/END tags not found in {readme_path}.")
         print(f"Please add these markers to your README.md:")
         print(f"  {start_tag}")
@@ -860,40 +1217,48 @@ def update_readme(widget_content: str, readme_path: Path = Path("README.md")):
         return False
     
     # Replace content between tags
-    before = content.split(start_tag)[0]
-    after = content.split(end_tag)[1]
     updated_content = f"{before}{start_tag}\n{widget_content}\n{end_tag}{after}"
     
-    readme_path.write_text(updated_content)
+    # Leave the file (and its mtime) alone when the section is already current
+    if updated_content == content:
+        print("✓ README.md PB section already up to date.")
+        return True
+    
+    readme_path.write_text(updated_content, encoding='utf-8')
     print("✓ README.md updated with new PB section.")
     return True
 
 
-def main():
+def main(argv: Optional[list] = None):
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="Update the Personal Best Tracker section in README.md.")
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="ignore cached pages and validators from previous runs (they are still refreshed)",
+    )
+    args = parser.parse_args(argv)
+    
     print("=" * 60)
     print("Starting Personal Best Tracker update...")
     print("=" * 60)
     
-    # Initialize scraper
-    scraper = AthleteicsDataScraper()
-    
-    # Scrape from both sources
-    opentrack_pbs = scraper.scrape_opentrack()
-    world_athletics_pbs = scraper.scrape_world_athletics()
-    scraper.scrape_athletics_malta_records()
-    
-    # Keep track of which records came from World Athletics
-    world_athletics_records = getattr(scraper, '_world_athletics_records', {})
-    
-    # Merge the data (taking best times from both sources)
-    merged_pbs = scraper.merge_times(opentrack_pbs, world_athletics_pbs)
-    
-    # Always consider known valid baseline PBs (keeps fastest of scraped vs baseline)
-    merged_pbs = scraper.merge_times(merged_pbs, FALLBACK_TIMES)
+    # Initialize scraper; leaving the block shuts down the shared browser if one was launched
+    with AthleteicsDataScraper(use_cache=not args.no_cache) as scraper:
+        # Scrape all sources concurrently
+        results = scraper.scrape_all()
+        opentrack_pbs = results['opentrack']
+        world_athletics_pbs = results['world_athletics']
+        
+        # Keep track of which records came from World Athletics
+        world_athletics_records = scraper._world_athletics_records
+        
+        # Merge the data in one pass, taking the best time from both sources and
+        # the known valid baseline PBs (keeps fastest of scraped vs baseline)
+        merged_pbs = scraper.merge_times(opentrack_pbs, world_athletics_pbs, FALLBACK_TIMES)
 
-    # Fetch all-time positions from Athletics Malta for current event set
-    scraper.scrape_athletics_malta_positions(merged_pbs)
+        # Fetch all-time positions from Athletics Malta for current event set
+        scraper.scrape_athletics_malta_positions(merged_pbs)
     
     if not merged_pbs:
         print("\nWARNING: No personal bests could be scraped from either source.")
@@ -906,7 +1271,7 @@ def main():
     widget_content = build_widget(merged_pbs, world_athletics_records, scraper)
     
     # Save widget to file (for debugging/backup)
-    Path("pb_widget.md").write_text(widget_content)
+    Path("pb_widget.md").write_text(widget_content, encoding='utf-8')
     print("✓ Widget saved to pb_widget.md")
     
     # Update README.md